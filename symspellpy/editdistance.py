@@ -19,8 +19,9 @@
 """
 
 import warnings
+from array import array
 from enum import Enum
-from typing import List, Optional
+from typing import Optional
 
 from editdistpy import damerau_osa, levenshtein
 
@@ -67,22 +68,17 @@ class EditDistance:
 
         self._distance_comparer: AbstractDistanceComparer
         self._algorithm = algorithm
-        if algorithm == DistanceAlgorithm.LEVENSHTEIN:
-            self._distance_comparer = Levenshtein()
-        elif algorithm == DistanceAlgorithm.DAMERAU_OSA:
-            self._distance_comparer = DamerauOsa()
-        elif algorithm == DistanceAlgorithm.LEVENSHTEIN_FAST:
-            self._distance_comparer = LevenshteinFast()
-        elif algorithm == DistanceAlgorithm.DAMERAU_OSA_FAST:
-            self._distance_comparer = DamerauOsaFast()
-        elif algorithm == DistanceAlgorithm.USER_PROVIDED:
+        if algorithm == DistanceAlgorithm.USER_PROVIDED:
             if not isinstance(comparer, AbstractDistanceComparer):
                 raise ValueError(
                     f"{algorithm.value} selected but no comparer passed in."
                 )
             self._distance_comparer = comparer
         else:
-            raise ValueError("unknown distance algorithm")
+            comparer_class = _COMPARER_TABLE.get(algorithm)
+            if comparer_class is None:
+                raise ValueError("unknown distance algorithm")
+            self._distance_comparer = comparer_class()
 
     def compare(self, string_1: str, string_2: str, max_distance: int) -> int:
         """Compares a string to the base string to determine the edit distance,
@@ -104,11 +100,11 @@ class Levenshtein(AbstractDistanceComparer):
     two strings.
 
     Attributes:
-        _base_char_1_costs (List[int]):
+        _base_char_1_costs (array):
     """
 
     def __init__(self):
-        self._base_char_1_costs = []
+        self._base_char_1_costs = array("i")
 
     def distance(self, string_1: str, string_2: str, max_distance: int) -> int:
         """Computes the Levenshtein edit distance between two strings.
@@ -127,6 +123,9 @@ class Levenshtein(AbstractDistanceComparer):
             return helpers.null_distance_results(string_1, string_2, max_distance)
         if max_distance <= 0:
             return 0 if string_1 == string_2 else -1
+        # identical strings need no distance calculation
+        if string_1 == string_2:
+            return 0
         max_distance = int(min(2**31 - 1, max_distance))
         # if strings of different lengths, ensure shorter string is in string_1.
         # This can result in a little faster speed by spending more time spinning
@@ -141,7 +140,9 @@ class Levenshtein(AbstractDistanceComparer):
             return len_2 if len_2 <= max_distance else -1
 
         if len_2 > len(self._base_char_1_costs):
-            self._base_char_1_costs = [0 for _ in range(len_2)]
+            self._base_char_1_costs.extend(
+                [0] * (len_2 - len(self._base_char_1_costs))
+            )
         if max_distance < len_2:
             return self._distance_max(
                 string_1,
@@ -163,13 +164,13 @@ class Levenshtein(AbstractDistanceComparer):
         len_1: int,
         len_2: int,
         start: int,
-        char_1_costs: List[int],
+        char_1_costs: array,
     ) -> int:
         """Internal implementation of the core Levenshtein algorithm.
 
         **From**: https://github.com/softwx/SoftWx.Match
         """
-        char_1_costs = [j + 1 for j in range(len_2)]
+        char_1_costs = array("i", range(1, len_2 + 1))
         current_cost = 0
         for i in range(len_1):
             left_char_cost = above_char_cost = i
@@ -196,16 +197,17 @@ class Levenshtein(AbstractDistanceComparer):
         len_2: int,
         start: int,
         max_distance: int,
-        char_1_costs: List[int],
+        char_1_costs: array,
     ) -> int:
         """Internal implementation of the core Levenshtein algorithm that accepts
         a max_distance.
 
         **From**: https://github.com/softwx/SoftWx.Match
         """
-        char_1_costs = [
-            j + 1 if j < max_distance else max_distance + 1 for j in range(len_2)
-        ]
+        char_1_costs = array(
+            "i",
+            (j + 1 if j < max_distance else max_distance + 1 for j in range(len_2)),
+        )
         len_diff = len_2 - len_1
         j_start_offset = max_distance - len_diff
         j_start = 0
@@ -241,13 +243,13 @@ class DamerauOsa(AbstractDistanceComparer):
     String Alignment (OSA) comparisons between two strings.
 
     Attributes:
-        _base_char_1_costs (List[int]):
-        _base_prev_char_1_costs (List[int]):
+        _base_char_1_costs (array):
+        _base_prev_char_1_costs (array):
     """
 
     def __init__(self) -> None:
-        self._base_char_1_costs: List[int] = []
-        self._base_prev_char_1_costs: List[int] = []
+        self._base_char_1_costs = array("i")
+        self._base_prev_char_1_costs = array("i")
 
     def distance(self, string_1: str, string_2: str, max_distance: int) -> int:
         """Computes the Damerau-Levenshtein optimal string alignment edit
@@ -267,6 +269,9 @@ class DamerauOsa(AbstractDistanceComparer):
             return helpers.null_distance_results(string_1, string_2, max_distance)
         if max_distance <= 0:
             return 0 if string_1 == string_2 else -1
+        # identical strings need no distance calculation
+        if string_1 == string_2:
+            return 0
         max_distance = int(min(2**31 - 1, max_distance))
         # if strings of different lengths, ensure shorter string is in string_1.
         # This can result in a little faster speed by spending more time spinning
@@ -281,8 +286,9 @@ class DamerauOsa(AbstractDistanceComparer):
             return len_2 if len_2 <= max_distance else -1
 
         if len_2 > len(self._base_char_1_costs):
-            self._base_char_1_costs = [0 for _ in range(len_2)]
-            self._base_prev_char_1_costs = [0 for _ in range(len_2)]
+            grow = [0] * (len_2 - len(self._base_char_1_costs))
+            self._base_char_1_costs.extend(grow)
+            self._base_prev_char_1_costs.extend(grow)
         if max_distance < len_2:
             return self._distance_max(
                 string_1,
@@ -311,15 +317,15 @@ class DamerauOsa(AbstractDistanceComparer):
         len_1: int,
         len_2: int,
         start: int,
-        char_1_costs: List[int],
-        prev_char_1_costs: List[int],
+        char_1_costs: array,
+        prev_char_1_costs: array,
     ) -> int:
         """Internal implementation of the core Damerau-Levenshtein, optimal
         string alignment algorithm.
 
         **From**: https://github.com/softwx/SoftWx.Match
         """
-        char_1_costs = [j + 1 for j in range(len_2)]
+        char_1_costs = array("i", range(1, len_2 + 1))
         char_1 = " "
         current_cost = 0
         for i in range(len_1):
@@ -365,17 +371,18 @@ class DamerauOsa(AbstractDistanceComparer):
         len_2: int,
         start: int,
         max_distance: int,
-        char_1_costs: List[int],
-        prev_char_1_costs: List[int],
+        char_1_costs: array,
+        prev_char_1_costs: array,
     ) -> int:
         """Internal implementation of the core Damerau-Levenshtein, optimal
         string alignment algorithm that accepts a max_distance.
 
         **From**: https://github.com/softwx/SoftWx.Match
         """
-        char_1_costs = [
-            j + 1 if j < max_distance else max_distance + 1 for j in range(len_2)
-        ]
+        char_1_costs = array(
+            "i",
+            (j + 1 if j < max_distance else max_distance + 1 for j in range(len_2)),
+        )
         len_diff = len_2 - len_1
         j_start_offset = max_distance - len_diff
         j_start = 0
@@ -467,3 +474,13 @@ class DamerauOsaFast(AbstractDistanceComparer):
                 increases as difference between the strings increases.
         """
         return damerau_osa.distance(string_1, string_2, max_distance)
+
+
+# Dispatch table for EditDistance.__init__. A dict lookup avoids the chained
+# enum equality checks when selecting a built-in comparer.
+_COMPARER_TABLE = {
+    DistanceAlgorithm.LEVENSHTEIN: Levenshtein,
+    DistanceAlgorithm.DAMERAU_OSA: DamerauOsa,
+    DistanceAlgorithm.LEVENSHTEIN_FAST: LevenshteinFast,
+    DistanceAlgorithm.DAMERAU_OSA_FAST: DamerauOsaFast,
+}
@@ -21,8 +21,18 @@
 import re
 import sys
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+# Minimum string length before prefix_suffix_prep switches from the
+# per-character scan to the memcmp-backed binary search.
+_AFFIX_SCAN_MIN_LEN = 16
+# \W non-words, use negated set to ignore non-words and "_" (underscore).
+# Compatible with non-latin characters, does not split words at apostrophes
+WORD_PATTERN = re.compile(r"([^\W_]+['’]*[^\W_]*)")
+# Lower bound of a 64-bit signed integer for try_parse_int64
+_INT64_MIN = -(2**63)
+
 
 def case_transfer_matching(cased_text: str, uncased_text: str) -> str:
     """Transfers the casing from one text to another - assuming that they are
@@ -43,6 +53,16 @@ def case_transfer_matching(cased_text: str, uncased_text: str) -> str:
             "'cased_text' and 'uncased_text' don't have the same length, use case_transfer_similar() instead"
         )
 
+    # fast paths for uniformly cased ASCII text, which skip the per-character
+    # loop below. Both strings must be ASCII: whole-string case conversion
+    # only agrees with the per-character loop when the converted text is free
+    # of context-sensitive Unicode mappings (e.g. final sigma)
+    if cased_text.isascii() and uncased_text.isascii():
+        if cased_text == cased_text.lower():
+            return uncased_text.lower()
+        if cased_text.isalpha() and cased_text.isupper():
+            return uncased_text.upper()
+
     return "".join(
         [
             y.upper() if x.isupper() else y.lower()
@@ -51,10 +71,14 @@ def case_transfer_matching(cased_text: str, uncased_text: str) -> str:
     )
 
 
+@lru_cache(maxsize=1024)
 def case_transfer_similar(cased_text: str, uncased_text: str) -> str:
     """Transfers the casing from one text to another - for similar (not matching)
     text.
 
+    Results are memoized since lookup and lookup_compound repeatedly transfer
+    casing between the same (phrase, term) pairs.
+
     Use `difflib.SequenceMatcher` to identify the different type of changes
     needed to turn `cased_text` into `uncased_text`.
 
@@ -85,7 +109,13 @@ def case_transfer_similar(cased_text: str, uncased_text: str) -> str:
     if not cased_text:
         raise ValueError("'cased_text' cannot be empty")
 
-    matcher = SequenceMatcher(a=cased_text.lower(), b=uncased_text)
+    lowered_text = cased_text.lower()
+    # the texts only differ in casing, so there is nothing to align and the
+    # single "equal" opcode would return cased_text unchanged
+    if lowered_text == uncased_text:
+        return cased_text
+
+    matcher = SequenceMatcher(a=lowered_text, b=uncased_text)
     result = ""
 
     for tag, ia1, ia2, ib1, ib2 in matcher.get_opcodes():
@@ -145,9 +175,22 @@ def is_acronym(word: str, contain_digits: bool = False) -> bool:
             abc12, ab12c. False if the word contains lower case letters, e.g.,
             abcde, ABCde, abcDE, abCDe.
     """
-    return re.match(r"\b[A-Z0-9]{2,}\b", word) is not None or (
-        contain_digits and any(i.isdigit() for i in word)
-    )
+    # hand-coded scan equivalent to matching r"\b[A-Z0-9]{2,}\b": the leading
+    # run of A-Z/0-9 must be at least two characters long and end at a word
+    # boundary (end of string or a non-word character)
+    run_len = 0
+    for char in word:
+        if "A" <= char <= "Z" or "0" <= char <= "9":
+            run_len += 1
+        else:
+            break
+    if run_len >= 2:
+        if run_len == len(word):
+            return True
+        boundary = word[run_len]
+        if not (boundary.isalnum() or boundary == "_"):
+            return True
+    return contain_digits and any(i.isdigit() for i in word)
 
 
 def null_distance_results(string1: str, string2: str, max_distance: int) -> int:
@@ -190,11 +233,9 @@ def parse_words(
         if preserve_case:
             return phrase.split()
         return phrase.lower().split()
-    # \W non-words, use negated set to ignore non-words and "_" (underscore).
-    # Compatible with non-latin characters, does not split words at apostrophes
     if preserve_case:
-        return re.findall(r"([^\W_]+['’]*[^\W_]*)", phrase)
-    return re.findall(r"([^\W_]+['’]*[^\W_]*)", phrase.lower())
+        return WORD_PATTERN.findall(phrase)
+    return WORD_PATTERN.findall(phrase.lower())
 
 
 def prefix_suffix_prep(string1: str, string2: str) -> Tuple[int, int, int]:
@@ -213,14 +254,38 @@ def prefix_suffix_prep(string1: str, string2: str) -> Tuple[int, int, int]:
     # this is also the minimun length of the two strings
     len1 = len(string1)
     len2 = len(string2)
-    # suffix common to both strings can be ignored
-    while len1 != 0 and string1[len1 - 1] == string2[len2 - 1]:
-        len1 -= 1
-        len2 -= 1
-    # prefix common to both strings can be ignored
-    start = 0
-    while start != len1 and string1[start] == string2[start]:
-        start += 1
+    if len1 < _AFFIX_SCAN_MIN_LEN:
+        # suffix common to both strings can be ignored
+        while len1 != 0 and string1[len1 - 1] == string2[len2 - 1]:
+            len1 -= 1
+            len2 -= 1
+        # prefix common to both strings can be ignored
+        start = 0
+        while start != len1 and string1[start] == string2[start]:
+            start += 1
+    else:
+        # binary search for the common affix lengths so each probe is a
+        # single C-level memcmp via str.endswith/str.startswith instead of
+        # a per-character Python loop
+        # suffix common to both strings can be ignored
+        lo, hi = 0, len1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if string1.endswith(string2[len2 - mid :]):
+                lo = mid
+            else:
+                hi = mid - 1
+        len1 -= lo
+        len2 -= lo
+        # prefix common to both strings can be ignored
+        lo, hi = 0, len1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if string2.startswith(string1[:mid]):
+                lo = mid
+            else:
+                hi = mid - 1
+        start = lo
     if start != 0:
         len1 -= start
         # length of the part excluding common prefix and suffix
@@ -255,11 +320,19 @@ def try_parse_int64(string: str) -> Optional[int]:
             the number is less than the min value or greater than the max value
             of a 64-bit signed integer.
     """
+    # unsigned decimal strings (the common case for frequency counts) can
+    # skip the try/except machinery. The length cap keeps the fast path
+    # below 2**63 territory and away from the int-str conversion digit
+    # limit; longer strings fall through to the guarded path below
+    if string.isdecimal() and len(string) <= 18:
+        return int(string)
     try:
         ret = int(string)
     except ValueError:
         return None
-    return ret if -(2**63) <= ret <= 2**63 - 1 else None
+    # bit_length is sign-agnostic, so every in-range value except the
+    # asymmetric minimum fits in 63 bits
+    return ret if ret.bit_length() < 64 or ret == _INT64_MIN else None
 
 
 class DictIO:
@@ -14,12 +14,27 @@
 
 import logging
 import sys
+from typing import Optional
 
 logger = logging.getLogger("symspellpy")
 
-handler = logging.StreamHandler(sys.stderr)
-handler.setFormatter(
-    logging.Formatter(fmt="%(asctime)s: %(levelname).1s %(name)s] %(message)s")
-)
+# As a library, leave handler configuration to the application; NullHandler
+# silences the "no handlers could be found" warning without emitting anywhere
+logger.addHandler(logging.NullHandler())
 
-logger.addHandler(handler)
+_stderr_handler: Optional[logging.StreamHandler] = None
+
+
+def enable_stderr_logging() -> None:
+    """Attaches a stderr handler to the symspellpy logger, restoring the
+    log output that was previously configured at import time. Safe to call
+    more than once; the handler is only attached the first time.
+    """
+    global _stderr_handler
+    if _stderr_handler is not None:
+        return
+    _stderr_handler = logging.StreamHandler(sys.stderr)
+    _stderr_handler.setFormatter(
+        logging.Formatter(fmt="%(asctime)s: %(levelname).1s %(name)s] %(message)s")
+    )
+    logger.addHandler(_stderr_handler)
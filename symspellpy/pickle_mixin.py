@@ -19,14 +19,18 @@
 """
 
 import gzip
+import io
 import logging
 import pickle
-from operator import itemgetter
 from pathlib import Path
 from typing import IO, Dict, List, Optional, Union, cast
 
 logger = logging.getLogger(__name__)
 
+# Protocol 5 (available from the minimum supported Python 3.8) frames large
+# dicts more efficiently than the interpreter default of 4
+_PICKLE_PROTOCOL = 5
+
 
 # Protocol only available in py38
 # class SymSpellProtocol(Protocol):
@@ -77,8 +81,13 @@ class PickleMixin:
             assert isinstance(data, bytes)
             return self._load_pickle_stream(data, from_bytes)
         if compressed:
+            # a large buffer turns the unpickler's many small reads into few
+            # big decompression calls
             with gzip.open(data, "rb") as gzip_infile:
-                return self._load_pickle_stream(cast(IO[bytes], gzip_infile))
+                buffered = io.BufferedReader(
+                    cast(io.RawIOBase, gzip_infile), buffer_size=2**20
+                )
+                return self._load_pickle_stream(cast(IO[bytes], buffered))
         else:
             with open(data, "rb") as infile:
                 return self._load_pickle_stream(infile)
@@ -138,17 +147,15 @@ class PickleMixin:
         if pickle_data.get("data_version", None) != self.data_version:
             return False
         settings = ("count_threshold", "max_dictionary_edit_distance", "prefix_length")
-        if itemgetter(*settings)(pickle_data) != (
-            self._count_threshold,
-            self._max_dictionary_edit_distance,
-            self._prefix_length,
+        if (
+            pickle_data["count_threshold"] != self._count_threshold
+            or pickle_data["max_dictionary_edit_distance"]
+            != self._max_dictionary_edit_distance
+            or pickle_data["prefix_length"] != self._prefix_length
         ):
             logger.warning(
                 f"Loading data which was created using different {settings} settings. Overwriting current SymSpell instance with loaded settings ..."
             )
-        self._deletes = pickle_data["deletes"]
-        self._words = pickle_data["words"]
-        self._max_length = pickle_data["max_length"]
         # Dictionary entries related variables
         self._below_threshold_words = pickle_data["below_threshold_words"]
         self._bigrams = pickle_data["bigrams"]
@@ -194,7 +201,7 @@ class PickleMixin:
             "data_version": self.data_version,
         }
         if to_bytes:
-            return pickle.dumps(pickle_data)
+            return pickle.dumps(pickle_data, protocol=_PICKLE_PROTOCOL)
         assert stream is not None
-        pickle.dump(pickle_data, stream)
+        pickle.dump(pickle_data, stream, protocol=_PICKLE_PROTOCOL)
         return None
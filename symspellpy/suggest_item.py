@@ -18,6 +18,10 @@
    :synopsis: Data class for :meth:`symspellpy.symspellpy.lookup`.
 """
 
+# Estimated word occurrence probabilities P=10 / (N * 10^word length l) for
+# create_with_probability, precomputed for the word lengths seen in practice
+_PROBABILITY_TABLE = tuple(10.0 / 10**length for length in range(64))
+
 
 class SuggestItem:
     """Spelling suggestion returned from :meth:`lookup`.
@@ -25,11 +29,14 @@ class SuggestItem:
     Args:
         term: The suggested word.
         distance: Edit distance from search word.
-        count: Frequency of suggestion in dictionary or Naive Bayes probability
-            of the individual suggestion parts.
+        count: Frequency of suggestion in dictionary, or Naive Bayes
+            probability of the individual suggestion parts (a float in the
+            probability case).
     """
 
-    def __init__(self, term: str, distance: int, count: int) -> None:
+    __slots__ = ("_term", "_distance", "_count")
+
+    def __init__(self, term: str, distance: int, count: float) -> None:
         self._term = term
         self._distance = distance
         self._count = count
@@ -64,15 +71,15 @@ class SuggestItem:
         return f"{self._term}, {self._distance}, {self._count}"
 
     @property
-    def count(self) -> int:
-        """Frequency of suggestion in the dictionary (a measure of how common the
-        word is) or Naive Bayes probability of the individual suggestion parts in
-        :meth:`lookup_compound`.
+    def count(self) -> float:
+        """Frequency of suggestion in the dictionary (a measure of how common
+        the word is), or Naive Bayes probability of the individual suggestion
+        parts in :meth:`lookup_compound` (a float).
         """
         return self._count
 
     @count.setter
-    def count(self, count: int) -> None:
+    def count(self, count: float) -> None:
         self._count = count
 
     @property
@@ -96,4 +103,7 @@ class SuggestItem:
     @classmethod
     def create_with_probability(cls, term: str, distance: int) -> "SuggestItem":
         """Creates a SuggestItem with Naive Bayes probability as the count."""
-        return cls(term, distance, 10 // 10 ** len(term))
+        length = len(term)
+        if length < 64:
+            return cls(term, distance, _PROBABILITY_TABLE[length])
+        return cls(term, distance, 10.0 ** (1 - length))
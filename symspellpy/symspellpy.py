@@ -24,10 +24,10 @@ import re
 import string
 import sys
 import unicodedata
-from collections import defaultdict
-from itertools import cycle
+from collections import Counter, defaultdict, deque
+from functools import lru_cache
 from pathlib import Path
-from typing import IO, Dict, List, Optional, Pattern, Set, Union
+from typing import IO, Deque, Dict, List, Optional, Pattern, Set, Tuple, Union
 
 from symspellpy import helpers
 from symspellpy.composition import Composition
@@ -37,7 +37,19 @@ from symspellpy.suggest_item import SuggestItem
 from symspellpy.verbosity import Verbosity
 
 logger = logging.getLogger(__name__)
-WORD_PATTERN = re.compile(r"(([^\W_]|['’])+)")
+WORD_PATTERN = re.compile(r"(?:[^\W_]|['’])+")
+# Number of characters to accumulate before create_dictionary tokenizes a
+# batch of corpus lines in one regex pass
+PARSE_WORDS_CHUNK_SIZE = 2**16
+
+
+@lru_cache(maxsize=None)
+def _unknown_word_log_prob(length: int, n: int) -> float:
+    """Estimated log probability of an unknown word of the given length,
+    log10(10 / (N * 10^length)). Cached since word_segmentation evaluates it
+    once per (start, length) window.
+    """
+    return math.log10(10.0 / n / 10.0 ** length)
 
 
 class SymSpell(PickleMixin):
@@ -175,19 +187,35 @@ class SymSpell(PickleMixin):
         Returns:
             ``True`` if file loaded, or ``False`` if file not found.
         """
+        # aggregate occurrences first so create_dictionary_entry (and the
+        # delete generation inside it) runs once per unique word instead of
+        # once per occurrence
+        word_counts: Counter = Counter()
         if isinstance(corpus, (Path, str)):
             corpus = Path(corpus)
             if not corpus.exists():
                 logger.error(f"Corpus not found at {corpus}.")
                 return False
-            for key in self._parse_words(
-                corpus.read_text(encoding=encoding, errors=errors)
-            ):
-                self.create_dictionary_entry(key, 1)
+            word_counts.update(
+                self._parse_words(corpus.read_text(encoding=encoding, errors=errors))
+            )
         else:
+            # batch lines so the tokenizer regex runs once per chunk instead
+            # of once per line. "\n" is a non-word character, so no token can
+            # span a line boundary in the joined text.
+            buffer: List[str] = []
+            buffer_len = 0
             for line in corpus:
-                for key in self._parse_words(line):
-                    self.create_dictionary_entry(key, 1)
+                buffer.append(line)
+                buffer_len += len(line)
+                if buffer_len >= PARSE_WORDS_CHUNK_SIZE:
+                    word_counts.update(self._parse_words("\n".join(buffer)))
+                    buffer.clear()
+                    buffer_len = 0
+            if buffer:
+                word_counts.update(self._parse_words("\n".join(buffer)))
+        for key, count in word_counts.items():
+            self.create_dictionary_entry(key, count)
         return True
 
     def create_dictionary_entry(self, key: str, count: int) -> bool:
@@ -382,6 +410,10 @@ class SymSpell(PickleMixin):
             max_edit_distance = self._max_dictionary_edit_distance
         if max_edit_distance > self._max_dictionary_edit_distance:
             raise ValueError("distance too large")
+        if ignore_token is not None:
+            # also accepts plain strings; compiling up front skips the
+            # re-module cache probe at the match site
+            ignore_token = re.compile(ignore_token)
         suggestions: List[SuggestItem] = []
         phrase_len = len(phrase)
 
@@ -409,7 +441,7 @@ class SymSpell(PickleMixin):
             if verbosity != Verbosity.ALL:
                 return early_exit()
 
-        if ignore_token is not None and re.match(ignore_token, phrase) is not None:
+        if ignore_token is not None and ignore_token.match(phrase) is not None:
             suggestion_count = 1
             suggestions.append(SuggestItem(phrase, 0, suggestion_count))
             # early exit - return exact match, unless caller wants all matches
@@ -427,19 +459,22 @@ class SymSpell(PickleMixin):
         considered_suggestions.add(phrase)
 
         max_edit_distance_2 = max_edit_distance
-        candidate_pointer = 0
-        candidates: List[str] = []
+        candidates: Deque[str] = deque()
+        # hoist instance attribute and bound-method lookups out of the BFS loop
+        deletes = self._deletes
+        words = self._words
+        prefix_length = self._prefix_length
+        distance_compare = self.distance_comparer.compare
 
         # add original prefix
         phrase_prefix_len = phrase_len
-        if phrase_prefix_len > self._prefix_length:
-            phrase_prefix_len = self._prefix_length
+        if phrase_prefix_len > prefix_length:
+            phrase_prefix_len = prefix_length
             candidates.append(phrase[:phrase_prefix_len])
         else:
             candidates.append(phrase)
-        while candidate_pointer < len(candidates):
-            candidate = candidates[candidate_pointer]
-            candidate_pointer += 1
+        while candidates:
+            candidate = candidates.popleft()
             candidate_len = len(candidate)
             len_diff = phrase_prefix_len - candidate_len
 
@@ -459,8 +494,8 @@ class SymSpell(PickleMixin):
                     continue
                 break  # pragma: no cover, "peephole" optimization, http://bugs.python.org/issue2506
 
-            if candidate in self._deletes:
-                dict_suggestions = self._deletes[candidate]
+            if candidate in deletes:
+                dict_suggestions = deletes[candidate]
                 for suggestion in dict_suggestions:
                     if suggestion == phrase:
                         continue
@@ -477,7 +512,7 @@ class SymSpell(PickleMixin):
                         or (suggestion_len == candidate_len and suggestion != candidate)
                     ):
                         continue  # pragma: no cover, "peephole" optimization, http://bugs.python.org/issue2506
-                    suggestion_prefix_len = min(suggestion_len, self._prefix_length)
+                    suggestion_prefix_len = min(suggestion_len, prefix_length)
                     if (
                         suggestion_prefix_len > phrase_prefix_len
                         and suggestion_prefix_len - candidate_len > max_edit_distance_2
@@ -515,7 +550,7 @@ class SymSpell(PickleMixin):
                         # phrase
                         distance = (
                             phrase_len
-                            if phrase.index(suggestion[0]) < 0
+                            if phrase.find(suggestion[0]) < 0
                             else phrase_len - 1
                         )
                         # `suggestion` only gets added to
@@ -536,15 +571,15 @@ class SymSpell(PickleMixin):
                     else:
                         # handles the shortcircuit of min_distance assignment
                         # when first boolean expression evaluates to False
-                        if self._prefix_length - max_edit_distance == candidate_len:
+                        if prefix_length - max_edit_distance == candidate_len:
                             min_distance = (
-                                min(phrase_len, suggestion_len) - self._prefix_length
+                                min(phrase_len, suggestion_len) - prefix_length
                             )
                         else:
                             min_distance = 0
                         # pylint: disable=too-many-boolean-expressions
                         if (
-                            self._prefix_length - max_edit_distance == candidate_len
+                            prefix_length - max_edit_distance == candidate_len
                             and (
                                 min_distance > 1
                                 and phrase[phrase_len + 1 - min_distance :]
@@ -568,7 +603,7 @@ class SymSpell(PickleMixin):
                         if suggestion in considered_suggestions:
                             continue
                         considered_suggestions.add(suggestion)
-                        distance = self.distance_comparer.compare(
+                        distance = distance_compare(
                             phrase, suggestion, max_edit_distance_2
                         )
                         if distance < 0:
@@ -577,7 +612,7 @@ class SymSpell(PickleMixin):
                     # if verbosity<ALL (note: max_edit_distance_2 will always
                     # equal max_edit_distance when Verbosity.ALL)
                     if distance <= max_edit_distance_2:  # pragma: no branch
-                        suggestion_count = self._words[suggestion]
+                        suggestion_count = words[suggestion]
                         item = SuggestItem(suggestion, distance, suggestion_count)
                         if suggestions:
                             if verbosity == Verbosity.CLOSEST:
@@ -599,7 +634,7 @@ class SymSpell(PickleMixin):
             # add edits: derive edits (deletes) from candidate (phrase) and add
             # them to candidates list. this is a recursive process until the
             # maximum edit distance has been reached
-            if len_diff < max_edit_distance and candidate_len <= self._prefix_length:
+            if len_diff < max_edit_distance and candidate_len <= prefix_length:
                 # do not create edits with edit distance smaller than
                 # suggestions already found
                 if verbosity != Verbosity.ALL and len_diff >= max_edit_distance_2:
@@ -610,7 +645,12 @@ class SymSpell(PickleMixin):
                         considered_deletes.add(delete)
                         candidates.append(delete)
         if len(suggestions) > 1:
-            suggestions.sort()
+            # key function mirrors SuggestItem.__lt__ (distance ascending,
+            # count descending) but is computed once per item instead of
+            # dispatching __lt__ per comparison
+            suggestions.sort(
+                key=lambda suggestion: (suggestion.distance, -suggestion.count)
+            )
 
         if transfer_casing:
             suggestions = [
@@ -689,11 +729,20 @@ class SymSpell(PickleMixin):
             suggestions = self.lookup(terms_1[i], Verbosity.TOP, max_edit_distance)
             # combi check, always before split
             if i > 0 and not is_last_combi:
-                suggestions_combi = self.lookup(
-                    terms_1[i - 1] + terms_1[i],
-                    Verbosity.TOP,
-                    max_edit_distance,
-                )
+                # combined term too long to match anything: lookup would take
+                # its length early exit anyway, so skip the concatenation and
+                # the call outright
+                if (
+                    len(terms_1[i - 1]) + len(terms_1[i]) - max_edit_distance
+                    > self._max_length
+                ):
+                    suggestions_combi: List[SuggestItem] = []
+                else:
+                    suggestions_combi = self.lookup(
+                        terms_1[i - 1] + terms_1[i],
+                        Verbosity.TOP,
+                        max_edit_distance,
+                    )
                 if suggestions_combi:
                     best_1 = suggestion_parts[-1]
                     if suggestions:
@@ -846,11 +895,12 @@ class SymSpell(PickleMixin):
         joined_term = joined_term.rstrip()
         if transfer_casing:
             joined_term = helpers.case_transfer_similar(phrase, joined_term)
-        suggestion = SuggestItem(
-            joined_term,
-            self.distance_comparer.compare(phrase, joined_term, 2**31 - 1),
-            int(joined_count),
-        )
+        # no correction was applied: skip the unbounded full-phrase compare
+        if joined_term == phrase:
+            distance = 0
+        else:
+            distance = self.distance_comparer.compare(phrase, joined_term, 2**31 - 1)
+        suggestion = SuggestItem(joined_term, distance, int(joined_count))
         return [suggestion]
 
     def word_segmentation(
@@ -900,9 +950,13 @@ class SymSpell(PickleMixin):
             max_segmentation_word_length = self._max_length
         array_size = min(max_segmentation_word_length, len(phrase))
         compositions = [Composition()] * array_size
-        circular_index = cycle(range(array_size))
         idx = -1
 
+        # per-character space flags, computed once: part starts at phrase[j],
+        # so the inner loop can test is_space[j] instead of calling
+        # str.isspace on every (j, i) slice
+        is_space = [char.isspace() for char in phrase]
+
         # outer loop (column): all possible part start positions
         for j in range(len(phrase)):
             # inner loop (row): all possible part lengths (from start position):
@@ -917,18 +971,18 @@ class SymSpell(PickleMixin):
                 top_log_prob = 0.0
                 top_result = ""
 
-                if part[0].isspace():
+                if is_space[j]:
                     # remove space for levensthein calculation
                     part = part[1:]
                 else:
                     # add ed+1: space did not exist, had to be inserted
                     separator_len = 1
 
-                # remove space from part1, add number of removed spaces to top_ed
-                top_ed += len(part)
-                # remove space. add number of removed spaces to ed
-                part = part.replace(" ", "")
-                top_ed -= len(part)
+                # remove space from part. add number of removed spaces to ed
+                num_spaces = part.count(" ")
+                if num_spaces:
+                    top_ed += num_spaces
+                    part = part.replace(" ", "")
 
                 # v6.7: Lookup against the lowercase term
                 results = self.lookup(
@@ -960,7 +1014,7 @@ class SymSpell(PickleMixin):
                     # would win as long unknown word (with ed=edmax+1), although
                     # there there should many spaces inserted
                     top_ed += len(part)
-                    top_log_prob = math.log10(10.0 / self.N / 10.0 ** len(part))
+                    top_log_prob = _unknown_word_log_prob(len(part), self.N)
 
                 dest = (i + idx) % array_size
                 # set values in first loop
@@ -968,39 +1022,39 @@ class SymSpell(PickleMixin):
                     compositions[dest] = Composition(
                         part, top_result, top_ed, top_log_prob
                     )
-                # pylint: disable=C0301,R0916
-                elif (
+                    continue
+                comp_src = compositions[idx]
+                comp_dest = compositions[dest]
+                src_distance_sum = comp_src.distance_sum + top_ed
+                # pylint: disable=C0301
+                if (
                     i == max_segmentation_word_length
                     # replace values if better log_prob_sum, if same edit
                     # distance OR one space difference
                     or (
-                        compositions[dest].distance_sum
-                        in (
-                            compositions[idx].distance_sum + top_ed,
-                            compositions[idx].distance_sum + separator_len + top_ed,
-                        )
-                        and compositions[dest].log_prob_sum
-                        < compositions[idx].log_prob_sum + top_log_prob
+                        comp_dest.distance_sum
+                        in (src_distance_sum, src_distance_sum + separator_len)
+                        and comp_dest.log_prob_sum
+                        < comp_src.log_prob_sum + top_log_prob
                     )
                     # replace values if smaller edit distance
-                    or compositions[idx].distance_sum + separator_len + top_ed
-                    < compositions[dest].distance_sum
+                    or src_distance_sum + separator_len < comp_dest.distance_sum
                 ):
                     if (
                         len(top_result) == 1 and top_result[0] in string.punctuation
                     ) or (len(top_result) == 2 and top_result.startswith("'")):
                         compositions[dest] = Composition.create(
-                            compositions[idx], part, top_result, top_ed, top_log_prob
+                            comp_src, part, top_result, top_ed, top_log_prob
                         )
                     else:
                         compositions[dest] = Composition.create(
-                            compositions[idx],
+                            comp_src,
                             f" {part}",
                             f" {top_result}",
                             separator_len + top_ed,
                             top_log_prob,
                         )
-            idx = next(circular_index)
+            idx = (idx + 1) % array_size
         return compositions[idx]
 
     def _delete_in_suggestion_prefix(
@@ -1035,16 +1089,21 @@ class SymSpell(PickleMixin):
         replaces + inserts replaces and inserts are expensive and language
         dependent.
         """
-        edit_distance += 1
-        if not word:
-            return delete_words
-        for i in range(current_distance, len(word)):
-            delete = word[:i] + word[i + 1 :]
-            if delete not in delete_words:
-                delete_words.add(delete)
-            # recursion, if maximum edit distance not yet reached
-            if edit_distance < self._max_dictionary_edit_distance:
-                self._edits(delete, edit_distance, delete_words, current_distance=i)
+        max_dictionary_edit_distance = self._max_dictionary_edit_distance
+        # explicit work queue instead of recursion: deletions are enumerated
+        # at non-decreasing positions, so each queue entry carries the
+        # position its children may start deleting from
+        pending: Deque[Tuple[str, int, int]] = deque()
+        pending.append((word, edit_distance + 1, current_distance))
+        while pending:
+            word, edit_distance, start = pending.popleft()
+            for i in range(start, len(word)):
+                delete = word[:i] + word[i + 1 :]
+                if delete not in delete_words:
+                    delete_words.add(delete)
+                # enqueue, if maximum edit distance not yet reached
+                if edit_distance < max_dictionary_edit_distance:
+                    pending.append((delete, edit_distance + 1, i))
         return delete_words
 
     def _edits_prefix(self, key: str) -> Set[str]:
@@ -1135,10 +1194,6 @@ class SymSpell(PickleMixin):
         # // \w Alphanumeric characters (including non-latin characters, umlaut
         # characters and digits) plus "_". [^\W_] is the equivalent of \w
         # excluding "_". Compatible with non-latin characters, does not split
-        # words at apostrophes. Uses capturing groups to combine a negated set
-        # with a character set.
-        matches: List[str] = WORD_PATTERN.findall(text.lower())
-        # The above regex returns ("ghi'jkl", "l") for "ghi'jkl", so we extract
-        # the first element
-        matches = [match[0] for match in matches]
-        return matches
+        # words at apostrophes. The group is non-capturing so findall returns
+        # the matched words directly.
+        return WORD_PATTERN.findall(text.lower())
@@ -4,6 +4,7 @@ from symspellpy.helpers import (
     case_transfer_matching,
     case_transfer_similar,
     is_acronym,
+    prefix_suffix_prep,
     to_similarity,
 )
 
@@ -39,6 +40,28 @@ def get_similar_texts():
     ]
 
 
+@pytest.fixture
+def get_affix_strings():
+    # (string1, string2, (len1, len2, start)); string1 is the shorter string.
+    # Strings shorter than 16 characters take the per-character branch, the
+    # rest take the binary-search branch
+    return [
+        # per-character branch
+        ("", "word", (0, 4, 0)),
+        ("abc", "abc", (0, 0, 0)),
+        ("kitten", "sitting", (6, 7, 0)),
+        ("abcd", "abxcd", (0, 1, 2)),
+        ("abcde", "xyabcde", (0, 2, 0)),
+        ("abcde", "abcdexy", (0, 2, 5)),
+        # binary-search branch
+        ("a" * 16, "a" * 16, (0, 0, 0)),
+        ("aaaaaaaaXbbbbbbbb", "aaaaaaaaYYbbbbbbbb", (1, 2, 8)),
+        ("a" * 16, "a" * 16 + "xyz", (0, 3, 16)),
+        ("a" * 16, "xyz" + "a" * 16, (0, 3, 0)),
+        ("abcdefghijklmnop", "abcdXfghijklmnop", (1, 1, 4)),
+    ]
+
+
 class TestHelpers:
     def test_to_similarity(self):
         length = 20.0
@@ -51,6 +74,10 @@ class TestHelpers:
             assert expected["default"] == is_acronym(word)
             assert expected["digits"] == is_acronym(word, True)
 
+    def test_prefix_suffix_prep(self, get_affix_strings):
+        for string1, string2, expected in get_affix_strings:
+            assert expected == prefix_suffix_prep(string1, string2)
+
     def test_case_transfer_matching_diff_lengths(self):
         with pytest.raises(ValueError) as excinfo:
             case_transfer_matching("abc", "abcd")
@@ -0,0 +1,27 @@
+import logging
+
+import symspellpy.logging
+from symspellpy.logging import enable_stderr_logging, logger
+
+
+class TestLogging:
+    def test_import_attaches_only_null_handler(self):
+        assert logging.getLogger("symspellpy") is logger
+
+        if symspellpy.logging._stderr_handler is None:
+            assert all(
+                isinstance(handler, logging.NullHandler)
+                for handler in logger.handlers
+            )
+
+    def test_enable_stderr_logging_is_idempotent(self):
+        enable_stderr_logging()
+
+        handler = symspellpy.logging._stderr_handler
+        assert isinstance(handler, logging.StreamHandler)
+        assert logger.handlers.count(handler) == 1
+
+        # repeated calls must not attach a second handler
+        enable_stderr_logging()
+        assert handler is symspellpy.logging._stderr_handler
+        assert logger.handlers.count(handler) == 1
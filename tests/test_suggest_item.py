@@ -38,3 +38,14 @@ class TestSuggestItem:
         assert 78 == si_1.count
 
         assert "qwer, 12, 78" == str(si_1)
+
+    def test_create_with_probability(self):
+        si = SuggestItem.create_with_probability("word", 3)
+
+        assert "word" == si.term
+        assert 3 == si.distance
+        # P = 10 / 10^len(term), and must not collapse to zero
+        assert pytest.approx(1e-3) == si.count
+        assert si.count > 0
+
+        assert SuggestItem.create_with_probability("a" * 100, 3).count > 0